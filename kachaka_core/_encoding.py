@@ -0,0 +1,13 @@
+"""Shared encoding helpers for camera frames and map images."""
+
+from __future__ import annotations
+
+import base64
+
+try:
+    # SIMD base64 (optional ``fast`` extra); output is identical to stdlib.
+    from pybase64 import b64encode_as_string as b64encode_str
+except ImportError:
+    def b64encode_str(data: bytes) -> str:
+        """Base64-encode *data* and return it as ``str``."""
+        return base64.b64encode(data).decode()
@@ -1,20 +1,20 @@
 """Background camera capture for Kachaka robots.
 
 Runs a daemon thread that periodically grabs a JPEG frame from the
-front or back camera, encodes it as base64, and stores it for
-thread-safe retrieval.  Errors are logged but never crash the thread.
+front or back camera and stores it for thread-safe retrieval
+(base64-encoded on first read).  Errors are logged but never crash the thread.
 
 Pattern derived from sync_camera_separate in connection-test Round 1.
 """
 
 from __future__ import annotations
 
-import base64
 import logging
 import threading
 import time
 from typing import TYPE_CHECKING, Callable, Optional
 
+from ._encoding import b64encode_str
 from .connection import ConnectionState, KachakaConnection
 
 if TYPE_CHECKING:
@@ -64,6 +64,7 @@ class CameraStreamer:
         # Frame storage (protected by lock)
         self._lock = threading.Lock()
         self._latest_frame: Optional[dict] = None
+        self._latest_jpeg: Optional[bytes] = None
 
         # Counters (only written by the capture thread, reads are atomic on CPython)
         self._total_frames: int = 0
@@ -116,18 +117,26 @@ class CameraStreamer:
 
     @property
     def latest_frame(self) -> Optional[dict]:
-        """Return the most recently captured frame (thread-safe)."""
+        """Return the most recently captured frame (thread-safe).
+
+        ``image_base64`` is encoded on the first read of each frame, so
+        frames nobody samples are never encoded.
+        """
         with self._lock:
-            return self._latest_frame
+            frame = self._latest_frame
+            if frame is not None and frame.get("ok") and "image_base64" not in frame:
+                frame["image_base64"] = b64encode_str(self._latest_jpeg)
+            return frame
 
     @property
     def latest_frame_bytes(self) -> bytes | None:
         """Most recent frame as raw JPEG bytes. None if no frame available."""
         with self._lock:
             frame = self._latest_frame
+            jpeg = self._latest_jpeg
         if frame is None or not frame.get("ok"):
             return None
-        return base64.b64decode(frame["image_base64"])
+        return jpeg
 
     @property
     def latest_detections(self) -> Optional[list]:
@@ -143,8 +152,10 @@ class CameraStreamer:
     @property
     def stats(self) -> dict:
         """Capture statistics: total_frames, dropped, drop_rate_pct, recovery metrics."""
-        total = self._total_frames
+        # Lock-free: read dropped first.  The capture thread bumps
+        # _total_frames before _dropped, so dropped <= total always holds.
         dropped = self._dropped
+        total = self._total_frames
         rate = (dropped / total * 100.0) if total > 0 else 0.0
         return {
             "total_frames": total,
@@ -190,7 +201,7 @@ class CameraStreamer:
             self._total_frames += 1
             try:
                 img = capture_fn()
-                b64 = base64.b64encode(img.data).decode()
+                jpeg = img.data
 
                 # Detection (if enabled)
                 det_objects = None
@@ -205,17 +216,19 @@ class CameraStreamer:
                 # Annotate (if enabled and detections available)
                 if self._annotate and det_objects:
                     try:
-                        annotated_bytes = self._detector.annotate_frame(img.data, det_objects)
-                        b64 = base64.b64encode(annotated_bytes).decode()
+                        jpeg = self._detector.annotate_frame(jpeg, det_objects)
                     except Exception:
                         logger.debug("Annotation error in streamer", exc_info=True)
 
                 frame: dict = {
                     "ok": True,
-                    "image_base64": b64,
                     "format": img.format or "jpeg",
                     "timestamp": time.time(),
                 }
+                # The callback sees every frame, so encode now; otherwise
+                # leave it to latest_frame, which encodes on first read.
+                if self._on_frame is not None:
+                    frame["image_base64"] = b64encode_str(jpeg)
 
                 # Add detection results to frame if available
                 if det_objects is not None:
@@ -223,6 +236,7 @@ class CameraStreamer:
 
                 with self._lock:
                     self._latest_frame = frame
+                    self._latest_jpeg = jpeg
                     if det_objects is not None:
                         self._latest_detections = det_objects
 
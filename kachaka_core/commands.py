@@ -512,12 +512,27 @@ class KachakaCommands:
     ) -> dict:
         """Block until the current command finishes or *timeout* expires.
 
+        Waits on the robot's cursor long-poll for ``GetCommandState``, so
+        completion is seen as soon as the state changes rather than on the
+        next tick.  *interval* is only the back-off after a failed poll.
+
         Returns the final command state.
         """
         start = time.time()
-        while time.time() - start < timeout:
+        cursor_meta = pb2.Metadata(cursor=0)
+        while True:
+            remaining = timeout - (time.time() - start)
+            if remaining <= 0:
+                break
             try:
-                if not self.sdk.is_command_running():
+                state = self.sdk.stub.GetCommandState(
+                    pb2.GetRequest(metadata=cursor_meta), timeout=remaining,
+                )
+                cursor_meta.cursor = state.metadata.cursor
+                if state.state not in (
+                    pb2.COMMAND_STATE_RUNNING,
+                    pb2.COMMAND_STATE_PENDING,
+                ):
                     result, cmd = self.sdk.get_last_command_result()
                     return {
                         "ok": result.success,
@@ -527,7 +542,11 @@ class KachakaCommands:
                     }
             except Exception as exc:
                 logger.debug("poll error: %s", exc)
-            time.sleep(interval)
+                # The failed call may itself have used up the budget.
+                remaining = timeout - (time.time() - start)
+                if remaining <= 0:
+                    break
+                time.sleep(min(interval, remaining))
         return {"ok": False, "error": "timeout", "timeout": timeout}
 
     # ── Torch / lighting ────────────────────────────────────────────
@@ -10,11 +10,13 @@ return_home, move_shelf, return_shelf, dock_any_shelf_with_registration) with:
 
 from __future__ import annotations
 
-import copy
 import logging
+import random
+import statistics
 import threading
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
 from typing import Callable, Optional
 
 from kachaka_api.generated import kachaka_api_pb2 as pb2
@@ -23,6 +25,9 @@ from .connection import ConnectionState, KachakaConnection
 
 logger = logging.getLogger(__name__)
 
+# Most recent poll RTTs kept by ControllerMetrics (bounded for long sessions).
+_RTT_HISTORY = 1000
+
 
 @dataclass
 class RobotState:
@@ -47,11 +52,21 @@ class RobotState:
     disconnected_at: Optional[float] = None
     last_reconnect_at: Optional[float] = None
 
+    def snapshot(self) -> RobotState:
+        """Shallow copy.  All fields are immutable scalars, so a field-wise
+        ``dataclasses.replace`` is enough."""
+        return replace(self)
 
-@dataclass
+
+@dataclass(slots=True)
 class ControllerMetrics:
-    """Metrics collected during command execution polling."""
-    poll_rtt_list: list[float] = field(default_factory=list)
+    """Metrics collected during command execution polling.
+
+    ``poll_rtt_list`` keeps only the most recent ``_RTT_HISTORY`` samples.
+    """
+    poll_rtt_list: deque[float] = field(
+        default_factory=lambda: deque(maxlen=_RTT_HISTORY)
+    )
     poll_count: int = 0
     poll_success_count: int = 0
     poll_failure_count: int = 0
@@ -62,22 +77,43 @@ class ControllerMetrics:
         self.poll_success_count = 0
         self.poll_failure_count = 0
 
+    def mean_rtt(self) -> float:
+        """Mean of the recorded RTTs in ms (0.0 if none)."""
+        return statistics.fmean(self.poll_rtt_list) if self.poll_rtt_list else 0.0
+
+    def p95_rtt(self) -> float:
+        """95th-percentile of the recorded RTTs in ms (0.0 if none)."""
+        rtts = self.poll_rtt_list
+        if len(rtts) < 2:
+            return rtts[0] if rtts else 0.0
+        # "inclusive" interpolates within the samples; the default
+        # "exclusive" extrapolates past the largest RTT on small windows.
+        return statistics.quantiles(rtts, n=20, method="inclusive")[-1]
+
 
 def _call_with_retry(
     func,
     *args,
     deadline: float,
     retry_delay: float = 1.0,
+    max_delay: float = 10.0,
     max_attempts: int = 0,
+    rng: Callable[[], float] = random.random,
     **kwargs,
 ):
     """Call func with retry until deadline or max_attempts.
 
+    Retries back off exponentially with full jitter: the n-th sleep is
+    ``min(retry_delay * 2**(n-1), max_delay) * rng()``, so controllers
+    that lose the robot together don't retry in lockstep.
+
     Args:
         func: Callable to invoke.
         deadline: Absolute time (perf_counter) after which to stop.
-        retry_delay: Seconds between retries.
+        retry_delay: Backoff base in seconds (ceiling of the first retry).
+        max_delay: Cap on the backoff ceiling.
         max_attempts: Max attempts (0 = unlimited, deadline only).
+        rng: Jitter source returning a float in [0, 1).
 
     Returns:
         The return value of func on success.
@@ -100,7 +136,9 @@ def _call_with_retry(
             remaining = deadline - time.perf_counter()
             if remaining <= 0:
                 break
-            time.sleep(min(retry_delay, remaining))
+            # Clamp the exponent: past ~1024 attempts 2**n no longer fits a float.
+            delay = min(retry_delay * (2 ** min(attempt - 1, 30)), max_delay) * rng()
+            time.sleep(min(delay, remaining))
     if last_err is not None:
         raise last_err
     raise TimeoutError("deadline exceeded without any attempt")
@@ -143,6 +181,7 @@ class RobotController:
         self._metrics = ControllerMetrics()
         self._monitoring_shelf: bool = False
         self._shelf_confirmed_docked: bool = False
+        self._last_slow: float = 0.0  # time.time() of last battery read
 
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
@@ -153,7 +192,7 @@ class RobotController:
     def state(self) -> RobotState:
         """Return a thread-safe snapshot of the current robot state."""
         with self._state_lock:
-            return copy.copy(self._state)
+            return self._state.snapshot()
 
     @property
     def metrics(self) -> ControllerMetrics:
@@ -209,8 +248,7 @@ class RobotController:
 
     def _state_loop(self) -> None:
         """Background thread: periodically read robot state."""
-        sdk = self._conn.client
-        last_slow = 0.0
+        self._last_slow = 0.0
 
         while not self._stop_event.is_set():
             # Skip polling while disconnected — avoids wasting 5s per
@@ -219,38 +257,45 @@ class RobotController:
                 self._stop_event.wait(self._fast_interval)
                 continue
 
-            now = time.time()
+            self._poll_cycle()
+            self._stop_event.wait(self._fast_interval)
+
+    def _poll_cycle(self) -> None:
+        """One fast-cycle read, plus the slow cycle when it is due.
+
+        Separate from :meth:`_state_loop` so it can run without the thread.
+        """
+        sdk = self._conn.client
+        now = time.time()
 
-            # Fast cycle: pose + command state + moving shelf
+        # Fast cycle: pose + command state + moving shelf
+        try:
+            pose = sdk.get_robot_pose()
+            is_running = sdk.is_command_running()
+            moving_shelf = sdk.get_moving_shelf_id() or None
+            with self._state_lock:
+                self._state.pose_x = pose.x
+                self._state.pose_y = pose.y
+                self._state.pose_theta = pose.theta
+                self._state.is_command_running = is_running
+                # Only update moving_shelf_id when shelf monitor is NOT active.
+                # During _execute_command, the shelf monitor in the polling loop
+                # owns this field to detect drops without race conditions.
+                if not self._monitoring_shelf:
+                    self._state.moving_shelf_id = moving_shelf
+                self._state.last_updated = now
+        except Exception:
+            logger.debug("State poll (fast) error", exc_info=True)
+
+        # Slow cycle: battery
+        if now - self._last_slow >= self._slow_interval:
             try:
-                pose = sdk.get_robot_pose()
-                is_running = sdk.is_command_running()
-                moving_shelf = sdk.get_moving_shelf_id() or None
+                battery_pct, _ = sdk.get_battery_info()
                 with self._state_lock:
-                    self._state.pose_x = pose.x
-                    self._state.pose_y = pose.y
-                    self._state.pose_theta = pose.theta
-                    self._state.is_command_running = is_running
-                    # Only update moving_shelf_id when shelf monitor is NOT active.
-                    # During _execute_command, the shelf monitor in the polling loop
-                    # owns this field to detect drops without race conditions.
-                    if not self._monitoring_shelf:
-                        self._state.moving_shelf_id = moving_shelf
-                    self._state.last_updated = now
+                    self._state.battery_pct = int(battery_pct)
+                self._last_slow = now
             except Exception:
-                logger.debug("State poll (fast) error", exc_info=True)
-
-            # Slow cycle: battery
-            if now - last_slow >= self._slow_interval:
-                try:
-                    battery_pct, _ = sdk.get_battery_info()
-                    with self._state_lock:
-                        self._state.battery_pct = int(battery_pct)
-                    last_slow = now
-                except Exception:
-                    logger.debug("State poll (slow/battery) error", exc_info=True)
-
-            self._stop_event.wait(self._fast_interval)
+                logger.debug("State poll (slow/battery) error", exc_info=True)
 
     # ── Connection state callback ─────────────────────────────
 
@@ -6,11 +6,12 @@ optionally annotates camera frames with bounding boxes using PIL.
 
 from __future__ import annotations
 
-import base64
+import functools
 import io
 import logging
 from typing import Optional
 
+from ._encoding import b64encode_str
 from .connection import KachakaConnection
 from .error_handling import with_retry
 
@@ -35,6 +36,20 @@ _LABEL_COLORS = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _label_font():
+    """Font for bbox labels, loaded once per process."""
+    from PIL import ImageFont
+
+    # Try to get a font; fall back to default
+    try:
+        return ImageFont.truetype(
+            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16
+        )
+    except (IOError, OSError):
+        return ImageFont.load_default()
+
+
 class ObjectDetector:
     """Object detection queries and frame annotation for a single Kachaka robot.
 
@@ -91,7 +106,7 @@ class ObjectDetector:
 
         return {
             "ok": True,
-            "image_base64": base64.b64encode(img.data).decode(),
+            "image_base64": b64encode_str(img.data),
             "format": img.format or "jpeg",
             "objects": [self._detection_to_dict(obj) for obj in objects],
         }
@@ -109,18 +124,14 @@ class ObjectDetector:
         Uses PIL ``ImageDraw``.  Rectangle 4 px, label text at top-left:
         ``"label, score=0.95, 2.3m"``
         """
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
 
         img = Image.open(io.BytesIO(image_bytes))
+        # Decode up front: a lazily-opened image is read-only, and
+        # ImageDraw would otherwise decode *and* copy the whole frame.
+        img.load()
         draw = ImageDraw.Draw(img)
-
-        # Try to get a font; fall back to default
-        try:
-            font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16
-            )
-        except (IOError, OSError):
-            font = ImageFont.load_default()
+        font = _label_font()
 
         for obj in objects:
             roi = obj.get("roi", {})
@@ -135,12 +146,13 @@ class ObjectDetector:
 
             color = _LABEL_COLORS.get(label, _LABEL_COLORS["unknown"])
 
-            # Draw rectangle (4px width)
-            for i in range(4):
-                draw.rectangle(
-                    [x - i, y - i, x + w + i, y + h + i],
-                    outline=color,
-                )
+            # Draw rectangle (4px width, growing outward from the ROI).
+            # PIL strokes ``width`` inward, so offset the outer box by 3px.
+            draw.rectangle(
+                [x - 3, y - 3, x + w + 3, y + h + 3],
+                outline=color,
+                width=4,
+            )
 
             # Label text
             text = f"{label}, score={score:.2f}"
@@ -11,12 +11,12 @@ Patterns extracted from:
 
 from __future__ import annotations
 
-import base64
 import logging
 import math
 
 from kachaka_api.generated import kachaka_api_pb2 as pb2
 
+from ._encoding import b64encode_str
 from .connection import KachakaConnection
 from .error_handling import with_retry
 
@@ -154,14 +154,14 @@ class KachakaQueries:
     def get_front_camera_image(self) -> dict:
         """Compressed JPEG from the front camera, returned as base64."""
         img = self.sdk.get_front_camera_ros_compressed_image()
-        b64 = base64.b64encode(img.data).decode()
+        b64 = b64encode_str(img.data)
         return {"ok": True, "image_base64": b64, "format": img.format or "jpeg"}
 
     @with_retry()
     def get_back_camera_image(self) -> dict:
         """Compressed JPEG from the back camera, returned as base64."""
         img = self.sdk.get_back_camera_ros_compressed_image()
-        b64 = base64.b64encode(img.data).decode()
+        b64 = b64encode_str(img.data)
         return {"ok": True, "image_base64": b64, "format": img.format or "jpeg"}
 
     # ── Camera intrinsics ───────────────────────────────────────────
@@ -227,7 +227,7 @@ class KachakaQueries:
         """
         try:
             img = self.sdk.get_tof_camera_ros_image()
-            b64 = base64.b64encode(img.data).decode()
+            b64 = b64encode_str(img.data)
             return {
                 "ok": True,
                 "image_base64": b64,
@@ -247,7 +247,7 @@ class KachakaQueries:
     def get_map(self) -> dict:
         """Current map as a base64-encoded PNG."""
         png_map = self.sdk.get_png_map()
-        b64 = base64.b64encode(png_map.data).decode()
+        b64 = b64encode_str(png_map.data)
         return {
             "ok": True,
             "image_base64": b64,
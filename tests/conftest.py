@@ -0,0 +1,58 @@
+"""Shared test fixtures."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import grpc
+import pytest
+
+
+class FakeClock:
+    """Virtual ``perf_counter``/``sleep`` pair: sleeping advances time instantly."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+        self.sleeps: list[float] = []
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch, clock_module):
+    """Run the test on a FakeClock swapped into *clock_module*'s ``time``.
+
+    Each test module that uses ``clock`` defines a ``clock_module`` fixture
+    returning the module under test.
+    """
+    fake = FakeClock()
+    monkeypatch.setattr(clock_module.time, "perf_counter", fake.perf_counter)
+    monkeypatch.setattr(clock_module.time, "sleep", fake.sleep)
+    return fake
+
+
+@pytest.fixture
+def channels(monkeypatch):
+    """Swap gRPC channel creation for Mocks; returns the channels created.
+
+    Each channel keeps the ``options`` it was created with, and every RPC on
+    it shares ``channel.unary_unary.return_value`` -- so setting that
+    callable's ``side_effect`` fails that channel.  Without this fixture the
+    connectivity probe in ``KachakaConnection.get`` makes real calls and
+    waits out the timeout.
+    """
+    created: list[Mock] = []
+
+    def fake_insecure_channel(target, options=None):
+        channel = Mock(options=options)
+        created.append(channel)
+        return channel
+
+    monkeypatch.setattr(grpc, "insecure_channel", fake_insecure_channel)
+    monkeypatch.setattr(grpc, "intercept_channel", lambda channel, *_: channel)
+    return created
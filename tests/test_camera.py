@@ -5,15 +5,28 @@ from __future__ import annotations
 import base64
 import threading
 import time
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import grpc
 import pytest
+from kachaka_api import KachakaApiClient
 
 from kachaka_core.connection import KachakaConnection
+from kachaka_core._encoding import b64encode_str
 from kachaka_core.camera import CameraStreamer
 
 
+# Shared compressed-image responses; the streamer only reads .data/.format.
+_FRAME = SimpleNamespace(data=b"\xff\xd8data", format="jpeg")
+_JPEG_FRAME = SimpleNamespace(data=b"\xff\xd8jpeg-data", format="jpeg")
+_RECOVERED_FRAME = SimpleNamespace(data=b"\xff\xd8recovered", format="jpeg")
+
+
+# KachakaConnection.get probes its channels; keep those off the network.
+pytestmark = pytest.mark.usefixtures("channels")
+
+
 @pytest.fixture(autouse=True)
 def _clean_pool():
     """Ensure each test starts with an empty connection pool."""
@@ -27,6 +40,36 @@ def _make_conn(mock_client):
         return KachakaConnection.get("test-robot")
 
 
+def _wait_frames(cs, n=1, timeout=2.0):
+    """Block until *cs* delivers *n* more frames to its ``on_frame`` hook.
+
+    Wraps the streamer's existing callback (if any), counting before it runs
+    so a raising callback still counts.  Call right after ``start()``.
+    """
+    done = threading.Event()
+    inner = cs._on_frame
+    count = 0
+
+    def counting(frame):
+        nonlocal count
+        count += 1
+        if count >= n:
+            done.set()
+        if inner is not None:
+            inner(frame)
+
+    cs._on_frame = counting
+    assert done.wait(timeout), f"fewer than {n} frame(s) within {timeout}s"
+
+
+def _wait_until(predicate, timeout=2.0):
+    """Block until *predicate()* is true (for counters with no callback)."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
 def _make_grpc_error(code=grpc.StatusCode.UNAVAILABLE, details="conn refused"):
     """Create a mock gRPC RpcError."""
     err = grpc.RpcError()
@@ -35,9 +78,19 @@ def _make_grpc_error(code=grpc.StatusCode.UNAVAILABLE, details="conn refused"):
     return err
 
 
+class TestEncoding:
+    def test_b64encode_matches_stdlib(self):
+        """The (possibly SIMD) frame encoder must match stdlib byte-for-byte."""
+        raw = bytes(range(256)) * 64 + b"\xff\xd8tail"
+        assert b64encode_str(raw) == base64.b64encode(raw).decode()
+
+    def test_b64encode_empty(self):
+        assert b64encode_str(b"") == ""
+
+
 class TestInit:
     def test_defaults(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
         cs = CameraStreamer(conn)
 
@@ -52,7 +105,7 @@ class TestInit:
         }
 
     def test_custom_params(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
         callback = MagicMock()
         cs = CameraStreamer(conn, interval=0.5, camera="back", on_frame=callback)
@@ -61,14 +114,14 @@ class TestInit:
         assert cs._camera == "back"
 
     def test_invalid_camera_raises(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
 
         with pytest.raises(ValueError, match="camera"):
             CameraStreamer(conn, camera="side")
 
     def test_invalid_camera_empty_raises(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
 
         with pytest.raises(ValueError, match="camera"):
@@ -77,10 +130,8 @@ class TestInit:
 
 class TestLifecycle:
     def test_start_sets_running(self):
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8jpeg-data", format="jpeg"
-        )
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _JPEG_FRAME
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05)
 
@@ -93,10 +144,8 @@ class TestLifecycle:
         assert cs.is_running is False
 
     def test_double_start_is_noop(self):
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8jpeg-data", format="jpeg"
-        )
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _JPEG_FRAME
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05)
 
@@ -108,7 +157,7 @@ class TestLifecycle:
             cs.stop()
 
     def test_stop_without_start_is_noop(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
         cs = CameraStreamer(conn)
 
@@ -116,10 +165,8 @@ class TestLifecycle:
         assert cs.is_running is False
 
     def test_thread_is_daemon(self):
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8jpeg-data", format="jpeg"
-        )
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _JPEG_FRAME
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05)
 
@@ -130,10 +177,8 @@ class TestLifecycle:
             cs.stop()
 
     def test_stop_joins_thread(self):
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8jpeg-data", format="jpeg"
-        )
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _JPEG_FRAME
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05)
 
@@ -142,78 +187,78 @@ class TestLifecycle:
 
         assert cs._thread is None or not cs._thread.is_alive()
 
-
-class TestCaptureFront:
-    def test_front_camera_frame(self):
-        mock = MagicMock()
-        raw = b"\xff\xd8front-jpeg-data"
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=raw, format="jpeg"
-        )
+    def test_stop_interrupts_interval_wait(self):
+        """stop() must not wait out the capture interval."""
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _JPEG_FRAME
         conn = _make_conn(mock)
-        cs = CameraStreamer(conn, interval=0.05, camera="front")
+        cs = CameraStreamer(conn, interval=10.0)
 
         cs.start()
-        time.sleep(0.15)  # allow at least one capture
+        # Poll rather than hook on_frame: with a 10 s interval the first
+        # frame may land before a hook could be installed.
+        _wait_until(lambda: cs.latest_frame is not None)
+        t0 = time.monotonic()
         cs.stop()
 
-        frame = cs.latest_frame
-        assert frame is not None
-        assert frame["ok"] is True
-        assert frame["format"] == "jpeg"
-        assert isinstance(frame["timestamp"], float)
-        # Verify base64 encoding
-        decoded = base64.b64decode(frame["image_base64"])
-        assert decoded == raw
+        assert time.monotonic() - t0 < 1.0
+        assert cs.is_running is False
+
 
+_CAMERA_METHODS = {
+    "front": "get_front_camera_ros_compressed_image",
+    "back": "get_back_camera_ros_compressed_image",
+}
 
-class TestCaptureBack:
-    def test_back_camera_frame(self):
-        mock = MagicMock()
-        raw = b"\xff\xd8back-jpeg-data"
-        mock.get_back_camera_ros_compressed_image.return_value = MagicMock(
+
+class TestCapture:
+    @pytest.mark.parametrize("camera", ["front", "back"])
+    def test_camera_frame(self, camera):
+        mock = Mock(spec=KachakaApiClient)
+        raw = b"\xff\xd8" + camera.encode() + b"-jpeg-data"
+        getattr(mock, _CAMERA_METHODS[camera]).return_value = SimpleNamespace(
             data=raw, format="jpeg"
         )
         conn = _make_conn(mock)
-        cs = CameraStreamer(conn, interval=0.05, camera="back")
+        cs = CameraStreamer(conn, interval=0.05, camera=camera)
 
         cs.start()
-        time.sleep(0.15)
+        _wait_frames(cs)
         cs.stop()
 
         frame = cs.latest_frame
         assert frame is not None
         assert frame["ok"] is True
+        assert frame["format"] == "jpeg"
+        assert isinstance(frame["timestamp"], float)
+        # Verify base64 encoding
         decoded = base64.b64decode(frame["image_base64"])
         assert decoded == raw
 
-    def test_back_camera_calls_correct_method(self):
-        mock = MagicMock()
-        mock.get_back_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8data", format="jpeg"
-        )
+    @pytest.mark.parametrize("camera,other", [("front", "back"), ("back", "front")])
+    def test_calls_correct_method(self, camera, other):
+        mock = Mock(spec=KachakaApiClient)
+        getattr(mock, _CAMERA_METHODS[camera]).return_value = _FRAME
         conn = _make_conn(mock)
-        cs = CameraStreamer(conn, interval=0.05, camera="back")
+        cs = CameraStreamer(conn, interval=0.05, camera=camera)
 
         cs.start()
-        time.sleep(0.15)
+        _wait_frames(cs)
         cs.stop()
 
-        mock.get_back_camera_ros_compressed_image.assert_called()
-        mock.get_front_camera_ros_compressed_image.assert_not_called()
+        getattr(mock, _CAMERA_METHODS[camera]).assert_called()
+        getattr(mock, _CAMERA_METHODS[other]).assert_not_called()
 
 
 class TestStats:
     def test_total_frames_count(self):
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8data", format="jpeg"
-        )
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _FRAME
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05, camera="front")
 
         cs.start()
-        time.sleep(0.25)
+        _wait_frames(cs, 2)
         cs.stop()
 
         stats = cs.stats
@@ -222,7 +267,7 @@ class TestStats:
         assert stats["drop_rate_pct"] == 0.0
 
     def test_dropped_frames_counted(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         call_count = 0
 
         def alternate_error():
@@ -230,14 +275,14 @@ class TestStats:
             call_count += 1
             if call_count % 2 == 1:
                 raise _make_grpc_error()
-            return MagicMock(data=b"\xff\xd8data", format="jpeg")
+            return _FRAME
 
         mock.get_front_camera_ros_compressed_image.side_effect = alternate_error
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05, camera="front")
 
         cs.start()
-        time.sleep(0.35)
+        _wait_frames(cs)  # one success implies at least one prior drop
         cs.stop()
 
         stats = cs.stats
@@ -246,7 +291,7 @@ class TestStats:
         assert stats["drop_rate_pct"] > 0.0
 
     def test_drop_rate_calculation(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=1.0, camera="front")
 
@@ -257,7 +302,7 @@ class TestStats:
         assert stats["drop_rate_pct"] == 30.0
 
     def test_drop_rate_zero_when_no_frames(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=1.0, camera="front")
 
@@ -267,33 +312,33 @@ class TestStats:
 
 class TestErrorHandling:
     def test_grpc_error_increments_dropped(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         mock.get_front_camera_ros_compressed_image.side_effect = _make_grpc_error()
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05, camera="front")
 
         cs.start()
-        time.sleep(0.2)
+        _wait_until(lambda: cs.stats["dropped"] >= 1)
         cs.stop()
 
         assert cs.stats["dropped"] >= 1
         assert cs.stats["total_frames"] >= 1
 
     def test_thread_does_not_crash_on_error(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         mock.get_front_camera_ros_compressed_image.side_effect = _make_grpc_error()
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05, camera="front")
 
         cs.start()
-        time.sleep(0.2)
+        _wait_until(lambda: cs.stats["dropped"] >= 2)
 
         # Thread should still be running despite errors
         assert cs.is_running is True
         cs.stop()
 
     def test_recovers_after_errors(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         call_count = 0
 
         def fail_then_succeed():
@@ -301,14 +346,14 @@ class TestErrorHandling:
             call_count += 1
             if call_count <= 3:
                 raise _make_grpc_error()
-            return MagicMock(data=b"\xff\xd8recovered", format="jpeg")
+            return _RECOVERED_FRAME
 
         mock.get_front_camera_ros_compressed_image.side_effect = fail_then_succeed
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05, camera="front")
 
         cs.start()
-        time.sleep(0.4)
+        _wait_frames(cs)
         cs.stop()
 
         frame = cs.latest_frame
@@ -318,13 +363,13 @@ class TestErrorHandling:
         assert decoded == b"\xff\xd8recovered"
 
     def test_generic_exception_increments_dropped(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         mock.get_front_camera_ros_compressed_image.side_effect = RuntimeError("oops")
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05, camera="front")
 
         cs.start()
-        time.sleep(0.2)
+        _wait_until(lambda: cs.stats["dropped"] >= 1)
         cs.stop()
 
         assert cs.stats["dropped"] >= 1
@@ -332,8 +377,8 @@ class TestErrorHandling:
 
 class TestCallback:
     def test_on_frame_called_with_frame_dict(self):
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = SimpleNamespace(
             data=b"\xff\xd8cb-data", format="jpeg"
         )
         callback = MagicMock()
@@ -341,7 +386,7 @@ class TestCallback:
         cs = CameraStreamer(conn, interval=0.05, camera="front", on_frame=callback)
 
         cs.start()
-        time.sleep(0.15)
+        _wait_frames(cs)
         cs.stop()
 
         assert callback.call_count >= 1
@@ -352,29 +397,27 @@ class TestCallback:
         assert "timestamp" in frame_arg
 
     def test_on_frame_not_called_on_error(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         mock.get_front_camera_ros_compressed_image.side_effect = _make_grpc_error()
         callback = MagicMock()
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05, camera="front", on_frame=callback)
 
         cs.start()
-        time.sleep(0.15)
+        _wait_until(lambda: cs.stats["dropped"] >= 2)
         cs.stop()
 
         callback.assert_not_called()
 
     def test_callback_exception_does_not_crash_thread(self):
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8data", format="jpeg"
-        )
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _FRAME
         callback = MagicMock(side_effect=RuntimeError("callback boom"))
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05, camera="front", on_frame=callback)
 
         cs.start()
-        time.sleep(0.2)
+        _wait_frames(cs)
 
         # Thread should still be alive despite callback errors
         assert cs.is_running is True
@@ -386,23 +429,33 @@ class TestCallback:
 
 class TestThreadSafety:
     def test_latest_frame_thread_safe_read(self):
-        """Ensure concurrent reads of latest_frame don't raise."""
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8data", format="jpeg"
-        )
+        """Concurrent reads of latest_frame stay consistent while frames arrive."""
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _FRAME
         conn = _make_conn(mock)
-        cs = CameraStreamer(conn, interval=0.02, camera="front")
+        # No on_frame hook: readers exercise the lazy encode-on-read path.
+        cs = CameraStreamer(conn, interval=0.01, camera="front")
+        expected_b64 = base64.b64encode(_FRAME.data).decode()
 
         errors = []
+        barrier = threading.Barrier(3)
+        start_frames = cs.stats["total_frames"]
+        # Spin until the streamer has written several new frames, so reads
+        # overlap capture-thread writes (bounded in case it stalls).
+        deadline = time.monotonic() + 5.0
 
         def read_loop():
-            for _ in range(50):
+            barrier.wait()
+            while (
+                cs.stats["total_frames"] - start_frames < 5
+                and time.monotonic() < deadline
+            ):
                 try:
-                    _ = cs.latest_frame
+                    frame = cs.latest_frame
+                    if frame is not None and frame["image_base64"] != expected_b64:
+                        errors.append(AssertionError("torn frame"))
                 except Exception as e:
                     errors.append(e)
-                time.sleep(0.01)
 
         cs.start()
         readers = [threading.Thread(target=read_loop) for _ in range(3)]
@@ -412,6 +465,7 @@ class TestThreadSafety:
             t.join()
         cs.stop()
 
+        assert cs.stats["total_frames"] - start_frames >= 5
         assert len(errors) == 0
 
 
@@ -420,7 +474,7 @@ class TestRecoveryMetrics:
 
     def test_longest_gap_zero_initially(self):
         """Before any frames, longest_gap_s should be 0."""
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=1.0)
 
@@ -428,22 +482,20 @@ class TestRecoveryMetrics:
 
     def test_recovery_latency_none_without_reconnect(self):
         """Without a reconnect event, recovery_latency_ms should be None."""
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8data", format="jpeg"
-        )
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _FRAME
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05)
 
         cs.start()
-        time.sleep(0.15)
+        _wait_frames(cs)
         cs.stop()
 
         assert cs.stats["recovery_latency_ms"] is None
 
     def test_stats_includes_longest_gap(self):
         """longest_gap_s should track max time between successful frames."""
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         call_count = 0
 
         def slow_then_fast():
@@ -453,14 +505,14 @@ class TestRecoveryMetrics:
             # Third call sleeps to create a measurable gap
             if call_count == 3:
                 time.sleep(0.15)
-            return MagicMock(data=b"\xff\xd8data", format="jpeg")
+            return _FRAME
 
         mock.get_front_camera_ros_compressed_image.side_effect = slow_then_fast
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.02)
 
         cs.start()
-        time.sleep(0.5)
+        _wait_frames(cs, 4)
         cs.stop()
 
         # The gap created by the 150ms sleep should be captured
@@ -470,17 +522,15 @@ class TestRecoveryMetrics:
         """recovery_latency_ms should measure time from reconnect to first frame."""
         from kachaka_core.connection import ConnectionState
 
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8data", format="jpeg"
-        )
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _FRAME
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05)
 
         # Simulate a reconnect event, then let a frame be captured
         cs.notify_state_change(ConnectionState.CONNECTED)
         cs.start()
-        time.sleep(0.15)
+        _wait_frames(cs)
         cs.stop()
 
         latency = cs.stats["recovery_latency_ms"]
@@ -491,16 +541,14 @@ class TestRecoveryMetrics:
         """Second successful frame after reconnect should not update recovery_latency_ms."""
         from kachaka_core.connection import ConnectionState
 
-        mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
-            data=b"\xff\xd8data", format="jpeg"
-        )
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _FRAME
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05)
 
         cs.notify_state_change(ConnectionState.CONNECTED)
         cs.start()
-        time.sleep(0.2)  # allow multiple frames
+        _wait_frames(cs, 2)  # allow multiple frames
         cs.stop()
 
         # Should have captured multiple frames
@@ -517,7 +565,7 @@ class TestRecoveryMetrics:
         """DISCONNECTED state should not set _reconnected_at."""
         from kachaka_core.connection import ConnectionState
 
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=1.0)
 
@@ -527,30 +575,44 @@ class TestRecoveryMetrics:
 
 class TestLatestFrameBytes:
     def test_returns_none_when_no_frame(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
         cs = CameraStreamer(conn)
         assert cs.latest_frame_bytes is None
 
     def test_returns_decoded_jpeg_bytes(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         raw = b"\xff\xd8jpeg-data-here"
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
+        mock.get_front_camera_ros_compressed_image.return_value = SimpleNamespace(
             data=raw, format="jpeg"
         )
         conn = _make_conn(mock)
         cs = CameraStreamer(conn, interval=0.05)
 
         cs.start()
-        time.sleep(0.15)
+        _wait_frames(cs)
         cs.stop()
 
         result = cs.latest_frame_bytes
         assert result == raw
         assert isinstance(result, bytes)
 
+    def test_frame_encoded_on_first_read(self):
+        mock = Mock(spec=KachakaApiClient)
+        mock.get_front_camera_ros_compressed_image.return_value = _JPEG_FRAME
+        conn = _make_conn(mock)
+        cs = CameraStreamer(conn, interval=10.0)
+
+        cs.start()
+        _wait_until(lambda: cs.latest_frame_bytes is not None)
+        cs.stop()
+
+        assert "image_base64" not in cs._latest_frame
+        frame = cs.latest_frame
+        assert base64.b64decode(frame["image_base64"]) == _JPEG_FRAME.data
+
     def test_returns_none_when_frame_not_ok(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock)
         cs = CameraStreamer(conn)
         cs._latest_frame = {"ok": False}
@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import tempfile
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import grpc
 import pytest
+from kachaka_api import KachakaApiClient
+from kachaka_api.generated import kachaka_api_pb2 as pb2
 
 from kachaka_core.commands import KachakaCommands
 from kachaka_core.connection import KachakaConnection
 
 
+# KachakaConnection.get probes its channels; keep those off the network.
+pytestmark = pytest.mark.usefixtures("channels")
+
+
 @pytest.fixture(autouse=True)
 def _clean_pool():
     KachakaConnection.clear_pool()
@@ -20,10 +27,7 @@ def _clean_pool():
 
 
 def _make_result(success: bool = True, error_code: int = 0):
-    r = MagicMock()
-    r.success = success
-    r.error_code = error_code
-    return r
+    return SimpleNamespace(success=success, error_code=error_code)
 
 
 def _make_conn(mock_client):
@@ -35,7 +39,7 @@ def _make_conn(mock_client):
 
 class TestMovement:
     def test_move_to_location_success(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.move_to_location.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -47,7 +51,7 @@ class TestMovement:
         assert result["target"] == "Kitchen"
 
     def test_move_to_location_failure(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.move_to_location.return_value = _make_result(False, error_code=101)
         conn = _make_conn(mock_client)
 
@@ -58,7 +62,7 @@ class TestMovement:
         assert result["error_code"] == 101
 
     def test_move_to_pose(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.move_to_pose.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -71,7 +75,7 @@ class TestMovement:
         )
 
     def test_return_home(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.return_home.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -84,7 +88,7 @@ class TestMovement:
 
 class TestShelfOps:
     def test_move_shelf(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.move_shelf.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -95,7 +99,7 @@ class TestShelfOps:
         assert "Shelf A" in result["target"]
 
     def test_dock_shelf(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.dock_shelf.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -103,7 +107,7 @@ class TestShelfOps:
         assert result["ok"] is True
 
     def test_dock_any_shelf_with_registration(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.dock_any_shelf_with_registration.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -114,7 +118,7 @@ class TestShelfOps:
         mock_client.dock_any_shelf_with_registration.assert_called_once()
 
     def test_dock_any_shelf_with_registration_forward(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.dock_any_shelf_with_registration.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -126,7 +130,7 @@ class TestShelfOps:
         assert args[1] is True  # dock_forward
 
     def test_reset_shelf_pose(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.reset_shelf_pose.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -137,7 +141,7 @@ class TestShelfOps:
 
 class TestSpeech:
     def test_speak(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.speak.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -146,7 +150,7 @@ class TestSpeech:
         assert result["target"] == "Hello"
 
     def test_set_volume_clamped(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.set_speaker_volume.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -156,7 +160,7 @@ class TestSpeech:
 
 class TestRetry:
     def test_retries_on_unavailable(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
 
         rpc_error = grpc.RpcError()
         rpc_error.code = lambda: grpc.StatusCode.UNAVAILABLE
@@ -172,7 +176,7 @@ class TestRetry:
         assert mock_client.speak.call_count == 3
 
     def test_no_retry_on_invalid_argument(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
 
         rpc_error = grpc.RpcError()
         rpc_error.code = lambda: grpc.StatusCode.INVALID_ARGUMENT
@@ -188,7 +192,7 @@ class TestRetry:
         assert mock_client.speak.call_count == 1
 
     def test_exhausted_retries(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
 
         rpc_error = grpc.RpcError()
         rpc_error.code = lambda: grpc.StatusCode.UNAVAILABLE
@@ -207,7 +211,7 @@ class TestRetry:
 
 class TestShortcut:
     def test_start_shortcut_success(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.start_shortcut_command.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -220,7 +224,7 @@ class TestShortcut:
         )
 
     def test_start_shortcut_failure(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.start_shortcut_command.return_value = _make_result(False, error_code=12506)
         conn = _make_conn(mock_client)
 
@@ -231,7 +235,7 @@ class TestShortcut:
 
 class TestMapManagement:
     def test_export_map_success(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.export_map.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -247,7 +251,7 @@ class TestMapManagement:
         assert result["size_bytes"] > 0
 
     def test_export_map_failure(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.export_map.return_value = _make_result(False, error_code=999)
         conn = _make_conn(mock_client)
 
@@ -256,7 +260,7 @@ class TestMapManagement:
         assert result["error_code"] == 999
 
     def test_import_map_success(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.import_map.return_value = (_make_result(True), "new-map-id")
         conn = _make_conn(mock_client)
 
@@ -266,7 +270,7 @@ class TestMapManagement:
         assert result["map_id"] == "new-map-id"
 
     def test_import_map_failure(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.import_map.return_value = (_make_result(False, error_code=500), "")
         conn = _make_conn(mock_client)
 
@@ -274,7 +278,7 @@ class TestMapManagement:
         assert result["ok"] is False
 
     def test_import_image_as_map_success(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_response = MagicMock()
         mock_response.result.success = True
         mock_response.map_id = "img-map-id"
@@ -299,7 +303,7 @@ class TestMapManagement:
         mock_stub.ImportImageAsMap.assert_called_once()
 
     def test_import_image_as_map_failure(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_response = MagicMock()
         mock_response.result.success = False
         mock_response.result.error_code = 12508
@@ -318,7 +322,7 @@ class TestMapManagement:
         assert result["ok"] is False
 
     def test_import_image_as_map_file_not_found(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock_client)
 
         result = KachakaCommands(conn).import_image_as_map(
@@ -330,7 +334,7 @@ class TestMapManagement:
 
 class TestSwitchMap:
     def test_switch_map_success(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.switch_map.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -343,7 +347,7 @@ class TestSwitchMap:
         )
 
     def test_switch_map_with_pose(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.switch_map.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -358,7 +362,7 @@ class TestSwitchMap:
         )
 
     def test_switch_map_failure(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.switch_map.return_value = _make_result(False, error_code=999)
         conn = _make_conn(mock_client)
 
@@ -367,7 +371,7 @@ class TestSwitchMap:
         assert result["error_code"] == 999
 
     def test_switch_map_exception(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.switch_map.side_effect = Exception("connection lost")
         conn = _make_conn(mock_client)
 
@@ -378,7 +382,7 @@ class TestSwitchMap:
 
 class TestTorch:
     def test_set_front_torch(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock_client)
         # Re-assign stub after _make_conn (which replaces it with a real one)
         mock_stub = MagicMock()
@@ -393,7 +397,7 @@ class TestTorch:
         mock_stub.SetFrontTorchIntensity.assert_called_once()
 
     def test_set_front_torch_clamped(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock_client)
         mock_stub = MagicMock()
         mock_response = MagicMock()
@@ -406,7 +410,7 @@ class TestTorch:
         assert call_args[0][0].intensity == 255
 
     def test_set_back_torch(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock_client)
         mock_stub = MagicMock()
         mock_response = MagicMock()
@@ -421,7 +425,7 @@ class TestTorch:
 
 class TestLaserScan:
     def test_activate_laser_scan(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock_client)
         mock_stub = MagicMock()
         mock_response = MagicMock()
@@ -438,7 +442,7 @@ class TestLaserScan:
 
 class TestAutoHoming:
     def test_set_auto_homing_enabled(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.set_auto_homing_enabled.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -448,7 +452,7 @@ class TestAutoHoming:
         mock_client.set_auto_homing_enabled.assert_called_once_with(True)
 
     def test_set_auto_homing_disabled(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.set_auto_homing_enabled.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -459,7 +463,7 @@ class TestAutoHoming:
 
 class TestManualControlShelfReg:
     def test_manual_control_with_shelf_registration(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock_client)
         # Re-assign stub after _make_conn (which replaces it with a real one)
         mock_stub = MagicMock()
@@ -478,7 +482,7 @@ class TestManualControlShelfReg:
         assert req.use_shelf_registration is True
 
     def test_manual_control_without_shelf_registration(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.set_manual_control_enabled.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -489,7 +493,7 @@ class TestManualControlShelfReg:
 
 class TestMoveShelfAdvanced:
     def test_move_shelf_undock_on_destination(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock_client)
         # Re-assign stub after _make_conn (which replaces it with a real one)
         mock_stub = MagicMock()
@@ -521,7 +525,7 @@ class TestMoveShelfAdvanced:
         assert req.command.move_shelf_command.undock_on_destination is True
 
     def test_move_shelf_default_uses_sdk(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.move_shelf.return_value = _make_result(True)
         conn = _make_conn(mock_client)
 
@@ -532,7 +536,7 @@ class TestMoveShelfAdvanced:
 
 class TestCancelCommand:
     def test_cancel_success(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.cancel_command.return_value = (_make_result(True), MagicMock())
         conn = _make_conn(mock_client)
 
@@ -542,7 +546,7 @@ class TestCancelCommand:
 
 class TestStop:
     def test_emergency_stop(self):
-        mock_client = MagicMock()
+        mock_client = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock_client)
 
         result = KachakaCommands(conn).stop()
@@ -551,22 +555,80 @@ class TestStop:
 
 
 class TestPollUntilComplete:
+    @staticmethod
+    def _state(state, cursor):
+        return SimpleNamespace(state=state, metadata=SimpleNamespace(cursor=cursor))
+
     def test_immediate_completion(self):
-        mock_client = MagicMock()
-        mock_client.is_command_running.return_value = False
+        mock_client = Mock(spec=KachakaApiClient)
+        mock_client.get_last_command_result.return_value = (
+            _make_result(True),
+            MagicMock(),
+        )
+        conn = _make_conn(mock_client)
+        mock_client.stub = MagicMock()
+        mock_client.stub.GetCommandState.return_value = self._state(
+            pb2.COMMAND_STATE_UNSPECIFIED, 1,
+        )
+
+        result = KachakaCommands(conn).poll_until_complete(timeout=5.0)
+        assert result["ok"] is True
+        mock_client.stub.GetCommandState.assert_called_once()
+
+    def test_follows_cursor_until_done(self):
+        mock_client = Mock(spec=KachakaApiClient)
+        mock_client.get_last_command_result.return_value = (
+            _make_result(True),
+            MagicMock(),
+        )
+        conn = _make_conn(mock_client)
+        mock_client.stub = MagicMock()
+        cursors = []
+        responses = iter([
+            self._state(pb2.COMMAND_STATE_RUNNING, 10),
+            self._state(pb2.COMMAND_STATE_UNSPECIFIED, 20),
+        ])
+
+        def get_state(req, timeout=None):
+            cursors.append(req.metadata.cursor)
+            return next(responses)
+
+        mock_client.stub.GetCommandState.side_effect = get_state
+
+        with patch("kachaka_core.commands.time.sleep") as mock_sleep:
+            result = KachakaCommands(conn).poll_until_complete(timeout=5.0)
+
+        assert result["ok"] is True
+        assert cursors == [0, 10]
+        mock_sleep.assert_not_called()
+
+    def test_pending_keeps_long_polling(self):
+        mock_client = Mock(spec=KachakaApiClient)
         mock_client.get_last_command_result.return_value = (
             _make_result(True),
             MagicMock(),
         )
         conn = _make_conn(mock_client)
+        mock_client.stub = MagicMock()
+        mock_client.stub.GetCommandState.side_effect = [
+            self._state(pb2.COMMAND_STATE_PENDING, 10),
+            self._state(pb2.COMMAND_STATE_RUNNING, 20),
+            self._state(pb2.COMMAND_STATE_UNSPECIFIED, 30),
+        ]
 
         result = KachakaCommands(conn).poll_until_complete(timeout=5.0)
+
         assert result["ok"] is True
+        assert mock_client.stub.GetCommandState.call_count == 3
+        mock_client.get_last_command_result.assert_called_once()
 
     def test_timeout(self):
-        mock_client = MagicMock()
-        mock_client.is_command_running.return_value = True
+        mock_client = Mock(spec=KachakaApiClient)
         conn = _make_conn(mock_client)
+        mock_client.stub = MagicMock()
+        mock_client.stub.GetCommandState.return_value = self._state(
+            pb2.COMMAND_STATE_RUNNING, 1,
+        )
 
         with patch("kachaka_core.commands.time.sleep"):
             with patch("kachaka_core.commands.time.time", side_effect=[0, 0, 999]):
@@ -575,10 +637,24 @@ class TestPollUntilComplete:
         assert result["ok"] is False
         assert result["error"] == "timeout"
 
+    def test_no_backoff_after_poll_times_out_at_deadline(self):
+        mock_client = Mock(spec=KachakaApiClient)
+        conn = _make_conn(mock_client)
+        mock_client.stub = MagicMock()
+        mock_client.stub.GetCommandState.side_effect = Exception("DEADLINE_EXCEEDED")
+
+        with patch("kachaka_core.commands.time.sleep") as mock_sleep:
+            # start, loop check, then the long-poll returns at the deadline
+            with patch("kachaka_core.commands.time.time", side_effect=[0, 0, 1.0]):
+                result = KachakaCommands(conn).poll_until_complete(timeout=1.0)
+
+        assert result["error"] == "timeout"
+        mock_sleep.assert_not_called()
+
 
 class TestSwitchMapInvalidation:
     def test_switch_map_invalidates_map_cache(self):
-        mock = MagicMock()
+        mock = Mock(spec=KachakaApiClient)
         mock_result = MagicMock(success=True, error_code=0)
         mock.switch_map.return_value = mock_result
         with patch("kachaka_core.connection.KachakaApiClient", return_value=mock):
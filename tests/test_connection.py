@@ -4,190 +4,191 @@ from __future__ import annotations
 
 import threading
 import time
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import grpc
 import pytest
+from kachaka_api import KachakaApiClient
+from kachaka_api.generated import kachaka_api_pb2 as pb2
 
-from kachaka_core.connection import ConnectionState, KachakaConnection
+from kachaka_core.connection import (
+    _CHANNELS_PER_TARGET,
+    ConnectionState,
+    KachakaConnection,
+    _RoundRobinStub,
+)
+
+
+def _make_rpc_error(code, details):
+    """Create a mock gRPC RpcError."""
+    err = grpc.RpcError()
+    err.code = lambda: code
+    err.details = lambda: details
+    return err
+
+
+_RPC_ERRORS = {
+    code: _make_rpc_error(code, details)
+    for code, details in [
+        (grpc.StatusCode.UNAVAILABLE, "Connection refused"),
+        (grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline Exceeded"),
+    ]
+}
+_UNAVAILABLE = _RPC_ERRORS[grpc.StatusCode.UNAVAILABLE]
 
 
 @pytest.fixture(autouse=True)
-def _clean_pool():
-    """Ensure each test starts with an empty connection pool."""
-    KachakaConnection.clear_pool()
-    yield
-    KachakaConnection.clear_pool()
+def _clean_pool(monkeypatch):
+    """Give each test its own empty connection pool."""
+    monkeypatch.setattr(KachakaConnection, "_pool", {})
 
 
-class TestNormaliseTarget:
-    def test_adds_default_port(self):
-        assert KachakaConnection._normalise_target("192.168.1.1") == "192.168.1.1:26400"
+@pytest.fixture
+def mock_client(monkeypatch, channels):
+    """Fresh spec'd client handed out by every ``KachakaApiClient(...)`` call."""
+    client = Mock(spec=KachakaApiClient)
+    monkeypatch.setattr(
+        "kachaka_core.connection.KachakaApiClient", lambda *a, **k: client,
+    )
+    return client
 
-    def test_preserves_explicit_port(self):
-        assert KachakaConnection._normalise_target("10.0.0.1:9999") == "10.0.0.1:9999"
 
-    def test_mdns_hostname(self):
-        assert KachakaConnection._normalise_target("kachaka-abc.local") == "kachaka-abc.local:26400"
+@pytest.fixture
+def default_conn(mock_client):
+    """Pooled connection to 1.2.3.4 backed by *mock_client*."""
+    return KachakaConnection.get("1.2.3.4")
 
 
-class TestPool:
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_same_ip_returns_same_instance(self, mock_cls):
-        mock_cls.return_value = MagicMock()
-        a = KachakaConnection.get("1.2.3.4")
-        b = KachakaConnection.get("1.2.3.4")
-        assert a is b
+class TestNormaliseTarget:
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("192.168.1.1", "192.168.1.1:26400"),  # default port added
+            ("10.0.0.1:9999", "10.0.0.1:9999"),  # explicit port kept
+            ("kachaka-abc.local", "kachaka-abc.local:26400"),  # mDNS hostname
+        ],
+    )
+    def test_normalise(self, raw, expected):
+        assert KachakaConnection._normalise_target(raw) == expected
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_different_ip_returns_different(self, mock_cls):
-        mock_cls.return_value = MagicMock()
-        a = KachakaConnection.get("1.2.3.4")
-        b = KachakaConnection.get("5.6.7.8")
-        assert a is not b
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_port_normalised_for_pool_key(self, mock_cls):
-        mock_cls.return_value = MagicMock()
+class TestPool:
+    def test_pool_semantics(self, mock_client):
         a = KachakaConnection.get("1.2.3.4")
-        b = KachakaConnection.get("1.2.3.4:26400")
-        assert a is b
+        b = KachakaConnection.get("1.2.3.4")
+        c = KachakaConnection.get("1.2.3.4:26400")  # port normalised for pool key
+        d = KachakaConnection.get("5.6.7.8")
+        assert a is b is c
+        assert a is not d
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_remove(self, mock_cls):
-        mock_cls.return_value = MagicMock()
-        KachakaConnection.get("1.2.3.4")
         KachakaConnection.remove("1.2.3.4")
         assert "1.2.3.4:26400" not in KachakaConnection._pool
+        assert "5.6.7.8:26400" in KachakaConnection._pool
+        assert KachakaConnection.get("1.2.3.4") is not a  # rebuilt after remove
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_clear_pool(self, mock_cls):
-        mock_cls.return_value = MagicMock()
-        KachakaConnection.get("1.2.3.4")
-        KachakaConnection.get("5.6.7.8")
         KachakaConnection.clear_pool()
         assert len(KachakaConnection._pool) == 0
 
 
+class TestChannelPool:
+    def test_stub_spans_separate_channels(self, mock_client, channels):
+        stub = KachakaConnection.get("1.2.3.4").client.stub
+
+        assert len(channels) == _CHANNELS_PER_TARGET
+        for channel in channels:
+            assert ("grpc.use_local_subchannel_pool", 1) in channel.options
+        # Every RPC built on a channel is that channel's unary_unary callable.
+        rpcs = [channel.unary_unary.return_value for channel in channels]
+        seen = [stub.GetRobotPose for _ in range(2 * _CHANNELS_PER_TARGET)]
+        assert seen == rpcs * 2
+
+    def test_round_robin_across_stubs(self):
+        stubs = [SimpleNamespace(GetRobotPose=i) for i in range(3)]
+        rr = _RoundRobinStub(stubs)
+        assert [rr.GetRobotPose for _ in range(4)] == [0, 1, 2, 0]
+
+
 class TestPing:
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_ping_success(self, mock_cls):
-        mock_client = MagicMock()
+    def test_ping_success(self, mock_client, default_conn):
         mock_client.get_robot_serial_number.return_value = "KCK-001"
-        mock_pose = MagicMock(x=1.0, y=2.0, theta=0.5)
+        mock_pose = SimpleNamespace(x=1.0, y=2.0, theta=0.5)
         mock_client.get_robot_pose.return_value = mock_pose
-        mock_cls.return_value = mock_client
 
-        conn = KachakaConnection.get("1.2.3.4")
-        result = conn.ping()
+        result = default_conn.ping()
 
         assert result["ok"] is True
         assert result["serial"] == "KCK-001"
         assert result["pose"] == {"x": 1.0, "y": 2.0, "theta": 0.5}
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_ping_grpc_error(self, mock_cls):
-        import grpc
-
-        mock_client = MagicMock()
+    @pytest.mark.parametrize("code", list(_RPC_ERRORS), ids=lambda c: c.name)
+    def test_ping_grpc_error(self, mock_client, default_conn, code):
         mock_client.get_robot_serial_number.return_value = "KCK-001"
-        rpc_error = grpc.RpcError()
-        rpc_error.code = lambda: grpc.StatusCode.UNAVAILABLE
-        rpc_error.details = lambda: "Connection refused"
-        mock_client.get_robot_pose.side_effect = rpc_error
-        mock_cls.return_value = mock_client
+        mock_client.get_robot_pose.side_effect = _RPC_ERRORS[code]
 
-        conn = KachakaConnection.get("1.2.3.4")
-        result = conn.ping()
+        result = default_conn.ping()
 
         assert result["ok"] is False
-        assert "UNAVAILABLE" in result["error"]
+        assert code.name in result["error"]
 
 
 class TestResolver:
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_ensure_resolver_fetches_shelves_and_locations(self, mock_cls):
-        mock_client = MagicMock()
-        mock_cls.return_value = mock_client
+    def test_ensure_resolver_fetches_shelves_and_locations(self, mock_client, default_conn):
+        mock_client.get_shelves.return_value = []
+        mock_client.get_locations.return_value = []
 
-        conn = KachakaConnection.get("1.2.3.4")
-        conn.ensure_resolver()
+        default_conn.ensure_resolver()
 
         mock_client.get_shelves.assert_called_once()
         mock_client.get_locations.assert_called_once()
         mock_client.update_resolver.assert_not_called()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_ensure_resolver_idempotent(self, mock_cls):
-        mock_client = MagicMock()
-        mock_cls.return_value = mock_client
+    def test_ensure_resolver_idempotent(self, mock_client, default_conn):
+        mock_client.get_shelves.return_value = []
+        mock_client.get_locations.return_value = []
 
-        conn = KachakaConnection.get("1.2.3.4")
-        conn.ensure_resolver()
-        conn.ensure_resolver()
+        default_conn.ensure_resolver()
+        default_conn.ensure_resolver()
 
         # Only called once because _resolver_ready is cached
         mock_client.get_shelves.assert_called_once()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_resolve_shelf_by_name_and_id(self, mock_cls):
-        mock_client = MagicMock()
-        shelf = MagicMock()
-        shelf.name = "ShelfA"
-        shelf.id = "S01"
+    def test_resolve_shelf_by_name_and_id(self, mock_client, default_conn):
+        shelf = SimpleNamespace(name="ShelfA", id="S01")
         mock_client.get_shelves.return_value = [shelf]
         mock_client.get_locations.return_value = []
-        mock_cls.return_value = mock_client
 
-        conn = KachakaConnection.get("1.2.3.4")
-        conn.ensure_resolver()
-
-        assert conn.resolve_shelf("ShelfA") == "S01"
-        assert conn.resolve_shelf("S01") == "S01"
-        assert conn.resolve_shelf("unknown") == "unknown"
-
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_resolve_location_by_name_and_id(self, mock_cls):
-        mock_client = MagicMock()
-        loc = MagicMock()
-        loc.name = "Kitchen"
-        loc.id = "L01"
+        default_conn.ensure_resolver()
+
+        assert default_conn.resolve_shelf("ShelfA") == "S01"
+        assert default_conn.resolve_shelf("S01") == "S01"
+        assert default_conn.resolve_shelf("unknown") == "unknown"
+
+    def test_resolve_location_by_name_and_id(self, mock_client, default_conn):
+        loc = SimpleNamespace(name="Kitchen", id="L01")
         mock_client.get_shelves.return_value = []
         mock_client.get_locations.return_value = [loc]
-        mock_cls.return_value = mock_client
 
-        conn = KachakaConnection.get("1.2.3.4")
-        conn.ensure_resolver()
+        default_conn.ensure_resolver()
 
-        assert conn.resolve_location("Kitchen") == "L01"
-        assert conn.resolve_location("L01") == "L01"
-        assert conn.resolve_location("unknown") == "unknown"
+        assert default_conn.resolve_location("Kitchen") == "L01"
+        assert default_conn.resolve_location("L01") == "L01"
+        assert default_conn.resolve_location("unknown") == "unknown"
 
 
 class TestMonitoring:
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_state_initially_connected(self, mock_cls):
-        mock_cls.return_value = MagicMock()
+    def test_state_initially_connected(self, mock_client):
         conn = KachakaConnection.get("1.2.3.4")
         assert conn.state == ConnectionState.CONNECTED
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_no_monitoring_by_default(self, mock_cls):
-        mock_cls.return_value = MagicMock()
+    def test_no_monitoring_by_default(self, mock_client):
         conn = KachakaConnection.get("1.2.3.4")
         assert conn._monitor_thread is None
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_monitoring_detects_disconnect(self, mock_cls):
-        mock_client = MagicMock()
-        mock_cls.return_value = mock_client
-
+    def test_monitoring_detects_disconnect(self, mock_client, channels):
         conn = KachakaConnection.get("1.2.3.4")
-        # Make ping fail
-        rpc_error = grpc.RpcError()
-        rpc_error.code = lambda: grpc.StatusCode.UNAVAILABLE
-        rpc_error.details = lambda: "gone"
-        mock_client.get_robot_serial_number.side_effect = rpc_error
+        # Make the probe fail
+        channels[0].unary_unary.return_value.side_effect = _UNAVAILABLE
 
         conn.start_monitoring(interval=0.05)
         try:
@@ -197,27 +198,19 @@ class TestMonitoring:
         finally:
             conn.stop_monitoring()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_monitoring_detects_reconnect(self, mock_cls):
-        mock_client = MagicMock()
-        mock_cls.return_value = mock_client
-
+    def test_monitoring_detects_reconnect(self, mock_client, channels):
         conn = KachakaConnection.get("1.2.3.4")
 
         # Start disconnected
-        rpc_error = grpc.RpcError()
-        rpc_error.code = lambda: grpc.StatusCode.UNAVAILABLE
-        rpc_error.details = lambda: "gone"
-        mock_client.get_robot_serial_number.side_effect = rpc_error
+        probe = channels[0].unary_unary.return_value
+        probe.side_effect = _UNAVAILABLE
 
         conn.start_monitoring(interval=0.05)
         try:
             conn.wait_for_state(ConnectionState.DISCONNECTED, timeout=2.0)
 
             # Restore connection
-            mock_client.get_robot_serial_number.side_effect = None
-            mock_client.get_robot_serial_number.return_value = "KCK-001"
-            mock_client.get_robot_pose.return_value = MagicMock(x=0, y=0, theta=0)
+            probe.side_effect = None
 
             reached = conn.wait_for_state(ConnectionState.CONNECTED, timeout=2.0)
             assert reached
@@ -225,18 +218,11 @@ class TestMonitoring:
         finally:
             conn.stop_monitoring()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_state_change_callback_called(self, mock_cls):
-        mock_client = MagicMock()
-        mock_cls.return_value = mock_client
-
+    def test_state_change_callback_called(self, mock_client, channels):
         conn = KachakaConnection.get("1.2.3.4")
         transitions = []
 
-        rpc_error = grpc.RpcError()
-        rpc_error.code = lambda: grpc.StatusCode.UNAVAILABLE
-        rpc_error.details = lambda: "gone"
-        mock_client.get_robot_serial_number.side_effect = rpc_error
+        channels[0].unary_unary.return_value.side_effect = _UNAVAILABLE
 
         conn.start_monitoring(interval=0.05, on_state_change=transitions.append)
         try:
@@ -245,12 +231,8 @@ class TestMonitoring:
         finally:
             conn.stop_monitoring()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_stop_monitoring_cleans_up(self, mock_cls):
-        mock_client = MagicMock()
+    def test_stop_monitoring_cleans_up(self, mock_client):
         mock_client.get_robot_serial_number.return_value = "KCK-001"
-        mock_client.get_robot_pose.return_value = MagicMock(x=0, y=0, theta=0)
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         conn.start_monitoring(interval=0.05)
@@ -258,24 +240,56 @@ class TestMonitoring:
         conn.stop_monitoring()
         assert conn._monitor_thread is None
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_wait_for_state_timeout(self, mock_cls):
-        mock_client = MagicMock()
+    def test_monitoring_probes_every_channel(self, mock_client, channels):
+        conn = KachakaConnection.get("1.2.3.4")
+        probes = [channel.unary_unary.return_value for channel in channels]
+        for probe in probes:
+            probe.reset_mock()
+        probed = threading.Event()
+        probes[-1].side_effect = lambda request: probed.set()
+
+        conn.start_monitoring(interval=0.01)
+        try:
+            assert probed.wait(2.0)
+        finally:
+            conn.stop_monitoring()
+        for probe in probes:
+            probe.assert_called_with(pb2.GetRequest())
+        mock_client.get_robot_pose.assert_not_called()
+
+    def test_one_failing_channel_holds_disconnected(self, mock_client, channels):
+        conn = KachakaConnection.get("1.2.3.4")
+        transitions = []
+        failing = channels[2].unary_unary.return_value
+        ticks = threading.Semaphore(0)
+
+        def fail(request):
+            ticks.release()
+            raise _UNAVAILABLE
+
+        failing.side_effect = fail
+
+        conn.start_monitoring(interval=0.01, on_state_change=transitions.append)
+        try:
+            # A probe through the round-robin stub hits the bad channel
+            # only every fourth tick, so state would flap back to CONNECTED.
+            for _ in range(10):
+                assert ticks.acquire(timeout=2.0)
+        finally:
+            conn.stop_monitoring()
+        assert transitions == [ConnectionState.DISCONNECTED]
+        assert conn.state == ConnectionState.DISCONNECTED
+
+    def test_wait_for_state_timeout(self, mock_client):
         mock_client.get_robot_serial_number.return_value = "KCK-001"
-        mock_client.get_robot_pose.return_value = MagicMock(x=0, y=0, theta=0)
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         # Don't start monitoring — state stays CONNECTED
         reached = conn.wait_for_state(ConnectionState.DISCONNECTED, timeout=0.1)
         assert reached is False
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_start_monitoring_idempotent(self, mock_cls):
-        mock_client = MagicMock()
+    def test_start_monitoring_idempotent(self, mock_client):
         mock_client.get_robot_serial_number.return_value = "KCK-001"
-        mock_client.get_robot_pose.return_value = MagicMock(x=0, y=0, theta=0)
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         conn.start_monitoring(interval=0.1)
@@ -287,41 +301,33 @@ class TestMonitoring:
 
 
 class TestCacheTier1:
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_serial_lazy_fetched_and_cached(self, mock_cls):
-        mock_client = MagicMock()
+    def test_serial_lazy_fetched_and_cached(self, mock_client):
         mock_client.get_robot_serial_number.return_value = "BKP40EB1T"
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
-        # _ensure_connected calls get_robot_serial_number once for connectivity check
+        # _ensure_connected probes the raw channels, not the client method
         calls_after_connect = mock_client.get_robot_serial_number.call_count
         assert conn.serial == "BKP40EB1T"
         assert conn.serial == "BKP40EB1T"  # second access uses cache
         # Only one additional call from the serial property (second access is cached)
         assert mock_client.get_robot_serial_number.call_count == calls_after_connect + 1
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_version_lazy_fetched_and_cached(self, mock_cls):
-        mock_client = MagicMock()
+    def test_version_lazy_fetched_and_cached(self, mock_client):
         mock_client.get_robot_version.return_value = "3.15.4"
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         assert conn.version == "3.15.4"
         assert conn.version == "3.15.4"
         mock_client.get_robot_version.assert_called_once()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_error_definitions_lazy_fetched_and_cached(self, mock_cls):
-        mock_client = MagicMock()
-        err_info = MagicMock()
-        err_info.title_en = "Shelf dropped"
-        err_info.description_en = "dropped during movement"
-        err_info.title = ""
-        err_info.description = ""
+    def test_error_definitions_lazy_fetched_and_cached(self, mock_client):
+        err_info = SimpleNamespace(
+            title_en="Shelf dropped",
+            description_en="dropped during movement",
+            title="",
+            description="",
+        )
         mock_client.get_robot_error_code.return_value = {14606: err_info}
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         defs = conn.error_definitions
@@ -330,31 +336,22 @@ class TestCacheTier1:
         _ = conn.error_definitions
         mock_client.get_robot_error_code.assert_called_once()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_error_definitions_fetch_failure_returns_empty(self, mock_cls):
-        mock_client = MagicMock()
+    def test_error_definitions_fetch_failure_returns_empty(self, mock_client):
         mock_client.get_robot_error_code.side_effect = RuntimeError("gRPC down")
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         assert conn.error_definitions == {}
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_serial_fetch_failure_returns_empty(self, mock_cls):
-        mock_client = MagicMock()
+    def test_serial_fetch_failure_returns_empty(self, mock_client):
         mock_client.get_robot_serial_number.side_effect = RuntimeError("fail")
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         assert conn.serial == ""
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_cache_thread_safe(self, mock_cls):
-        mock_client = MagicMock()
+    def test_cache_thread_safe(self, mock_client):
         mock_client.get_robot_serial_number.return_value = "KCK-001"
         mock_client.get_robot_version.return_value = "3.15.4"
         mock_client.get_robot_error_code.return_value = {}
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         errors = []
@@ -377,14 +374,9 @@ class TestCacheTier1:
 
 
 class TestCacheTier2:
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_shortcuts_lazy_fetched_and_cached(self, mock_cls):
-        mock_client = MagicMock()
-        sc = MagicMock()
-        sc.id = "sc-1"
-        sc.name = "Patrol A"
+    def test_shortcuts_lazy_fetched_and_cached(self, mock_client):
+        sc = SimpleNamespace(id="sc-1", name="Patrol A")
         mock_client.get_shortcuts.return_value = [sc]
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         shortcuts = conn.shortcuts
@@ -393,14 +385,9 @@ class TestCacheTier2:
         _ = conn.shortcuts
         mock_client.get_shortcuts.assert_called_once()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_map_list_lazy_fetched_and_cached(self, mock_cls):
-        mock_client = MagicMock()
-        m = MagicMock()
-        m.id = "map-1"
-        m.name = "Floor1"
+    def test_map_list_lazy_fetched_and_cached(self, mock_client):
+        m = SimpleNamespace(id="map-1", name="Floor1")
         mock_client.get_map_list.return_value = [m]
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         maps = conn.map_list
@@ -409,29 +396,24 @@ class TestCacheTier2:
         _ = conn.map_list
         mock_client.get_map_list.assert_called_once()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_current_map_id_lazy_fetched_and_cached(self, mock_cls):
-        mock_client = MagicMock()
+    def test_current_map_id_lazy_fetched_and_cached(self, mock_client):
         mock_client.get_current_map_id.return_value = "map-1"
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         assert conn.current_map_id == "map-1"
         assert conn.current_map_id == "map-1"
         mock_client.get_current_map_id.assert_called_once()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_map_image_lazy_fetched_and_cached(self, mock_cls):
-        mock_client = MagicMock()
-        png_map = MagicMock()
-        png_map.data = b"\x89PNGtest"
-        png_map.resolution = 0.05
-        png_map.width = 200
-        png_map.height = 200
-        png_map.name = "Floor1"
-        png_map.origin = MagicMock(x=0.0, y=0.0)
+    def test_map_image_lazy_fetched_and_cached(self, mock_client):
+        png_map = SimpleNamespace(
+            data=b"\x89PNGtest",
+            resolution=0.05,
+            width=200,
+            height=200,
+            name="Floor1",
+            origin=SimpleNamespace(x=0.0, y=0.0),
+        )
         mock_client.get_png_map.return_value = png_map
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         img = conn.map_image
@@ -440,11 +422,8 @@ class TestCacheTier2:
         _ = conn.map_image
         mock_client.get_png_map.assert_called_once()
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_refresh_shortcuts_clears_cache(self, mock_cls):
-        mock_client = MagicMock()
+    def test_refresh_shortcuts_clears_cache(self, mock_client):
         mock_client.get_shortcuts.return_value = []
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         _ = conn.shortcuts
@@ -452,20 +431,18 @@ class TestCacheTier2:
         _ = conn.shortcuts
         assert mock_client.get_shortcuts.call_count == 2
 
-    @patch("kachaka_core.connection.KachakaApiClient")
-    def test_refresh_maps_clears_all_map_cache(self, mock_cls):
-        mock_client = MagicMock()
+    def test_refresh_maps_clears_all_map_cache(self, mock_client):
         mock_client.get_map_list.return_value = []
         mock_client.get_current_map_id.return_value = "map-1"
-        png_map = MagicMock()
-        png_map.data = b"\x89PNG"
-        png_map.resolution = 0.05
-        png_map.width = 100
-        png_map.height = 100
-        png_map.name = "F1"
-        png_map.origin = MagicMock(x=0.0, y=0.0)
+        png_map = SimpleNamespace(
+            data=b"\x89PNG",
+            resolution=0.05,
+            width=100,
+            height=100,
+            name="F1",
+            origin=SimpleNamespace(x=0.0, y=0.0),
+        )
         mock_client.get_png_map.return_value = png_map
-        mock_cls.return_value = mock_client
 
         conn = KachakaConnection.get("1.2.3.4")
         _ = conn.map_list
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import base64
+import functools
 import io
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -17,8 +19,9 @@ from kachaka_core.connection import KachakaConnection
 # ── Helpers ───────────────────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=8)
 def _make_test_jpeg(width: int = 640, height: int = 480) -> bytes:
-    """Create a small real JPEG image for testing."""
+    """Create a small real JPEG image for testing (cached; bytes are immutable)."""
     img = Image.new("RGB", (width, height), color=(128, 128, 128))
     buf = io.BytesIO()
     img.save(buf, format="JPEG")
@@ -38,16 +41,13 @@ class TestObjectDetector:
         score: float = 0.95,
         distance: float = 2.3,
     ):
-        """Helper to create a mock ObjectDetection."""
-        det = MagicMock()
-        det.label = label
-        det.roi.x_offset = x
-        det.roi.y_offset = y
-        det.roi.width = w
-        det.roi.height = h
-        det.score = score
-        det.distance_median = distance
-        return det
+        """Helper to create a stand-in ObjectDetection proto."""
+        return SimpleNamespace(
+            label=label,
+            roi=SimpleNamespace(x_offset=x, y_offset=y, width=w, height=h),
+            score=score,
+            distance_median=distance,
+        )
 
     def _make_conn(self, detections=None, image_bytes: bytes = b"fake-jpeg"):
         """Create mock conn with sdk."""
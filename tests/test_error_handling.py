@@ -3,22 +3,29 @@
 from __future__ import annotations
 
 import time
-from unittest.mock import MagicMock, patch
 
 import grpc
 import pytest
 
+import kachaka_core.error_handling
 from kachaka_core.error_handling import with_retry, RETRYABLE_CODES
 
 
 def _make_rpc_error(code: grpc.StatusCode, details: str = "") -> grpc.RpcError:
     """Create a mock gRPC RpcError."""
     exc = grpc.RpcError()
-    exc.code = MagicMock(return_value=code)
-    exc.details = MagicMock(return_value=details)
+    exc.code = lambda: code
+    exc.details = lambda: details
     return exc
 
 
+@pytest.fixture
+def clock_module():
+    """Module whose ``time`` the shared ``clock`` fixture patches."""
+    return kachaka_core.error_handling
+
+
+@pytest.mark.usefixtures("clock")
 class TestWithRetryExisting:
     """Verify existing count-based behavior is unchanged."""
 
@@ -66,6 +73,7 @@ class TestWithRetryExisting:
         assert result["attempts"] == 2
 
 
+@pytest.mark.usefixtures("clock")
 class TestWithRetryDeadline:
     """Test new deadline mode."""
 
@@ -153,8 +161,9 @@ class TestWithRetryDeadline:
         elapsed = time.perf_counter() - start
 
         assert result["ok"] is False
-        # Should finish within deadline + one max_delay margin
-        assert elapsed < 0.6, f"Took {elapsed:.2f}s, expected < 0.6s"
+        # Backoff sleeps are capped by the remaining time, so the
+        # (virtual) run never passes the deadline
+        assert elapsed == pytest.approx(0.3)
 
     def test_deadline_backoff_capped_by_remaining_time(self):
         """Sleep should not exceed remaining time before deadline."""
@@ -169,8 +178,9 @@ class TestWithRetryDeadline:
         op()
         elapsed = time.perf_counter() - start
 
-        # Even though max_delay=10s, should finish around deadline
-        assert elapsed < 0.8
+        # Even though max_delay=10s, should finish at the deadline
+        assert elapsed == pytest.approx(0.4)
+        assert len(call_times) >= 3
 
     def test_deadline_includes_attempts_in_result(self):
         """Result should include attempt count."""
@@ -73,21 +73,21 @@ class TestTimeoutInterceptor:
         assert captured["method"] == "/kachaka/GetPose"
         assert captured["metadata"] == [("key", "value")]
 
-    def test_custom_default_timeout(self):
+    @pytest.mark.parametrize("timeout_val", [1.0, 5.0, 30.0])
+    def test_custom_default_timeout(self, timeout_val):
         """Different default_timeout values should be applied."""
-        for timeout_val in [1.0, 5.0, 30.0]:
-            interceptor = TimeoutInterceptor(default_timeout=timeout_val)
-            original = FakeCallDetails(timeout=None)
-            captured = {}
+        interceptor = TimeoutInterceptor(default_timeout=timeout_val)
+        original = FakeCallDetails(timeout=None)
+        captured = {}
 
-            def fake_continuation(call_details, request):
-                captured["timeout"] = call_details.timeout
-                return "ok"
+        def fake_continuation(call_details, request):
+            captured["timeout"] = call_details.timeout
+            return "ok"
 
-            interceptor.intercept_unary_unary(
-                fake_continuation, original, b"req"
-            )
-            assert captured["timeout"] == timeout_val
+        interceptor.intercept_unary_unary(
+            fake_continuation, original, b"req"
+        )
+        assert captured["timeout"] == timeout_val
 
 
 class TestTimeoutInterceptorIntegration:
@@ -2,30 +2,24 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
-
-import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from kachaka_core.connection import KachakaConnection
 from kachaka_core.queries import KachakaQueries
 
 
-@pytest.fixture(autouse=True)
-def _clean_pool():
-    KachakaConnection.clear_pool()
-    yield
-    KachakaConnection.clear_pool()
-
-
 def _make_conn(mock_client):
-    with patch("kachaka_core.connection.KachakaApiClient", return_value=mock_client):
-        return KachakaConnection.get("test-robot")
+    """Wrap *mock_client* in a KachakaConnection without touching the pool."""
+    conn = KachakaConnection("test-robot")
+    conn._client = mock_client
+    return conn
 
 
 class TestGetStatus:
     def test_full_status(self):
         mock = MagicMock()
-        mock.get_robot_pose.return_value = MagicMock(x=1.0, y=2.0, theta=0.5)
+        mock.get_robot_pose.return_value = SimpleNamespace(x=1.0, y=2.0, theta=0.5)
         mock.get_battery_info.return_value = (85.0, "CHARGING")
         mock.get_command_state.return_value = ("PENDING", None)
         mock.get_error.return_value = []
@@ -44,11 +38,12 @@ class TestGetStatus:
 class TestLocations:
     def test_list_locations(self):
         mock = MagicMock()
-        loc = MagicMock()
-        loc.id = "loc-1"
-        loc.name = "Kitchen"
-        loc.type = "CHARGER"
-        loc.pose = MagicMock(x=0.0, y=0.0, theta=0.0)
+        loc = SimpleNamespace(
+            id="loc-1",
+            name="Kitchen",
+            type="CHARGER",
+            pose=SimpleNamespace(x=0.0, y=0.0, theta=0.0),
+        )
         mock.get_locations.return_value = [loc]
         conn = _make_conn(mock)
 
@@ -62,10 +57,7 @@ class TestLocations:
 class TestShelves:
     def test_list_shelves(self):
         mock = MagicMock()
-        shelf = MagicMock()
-        shelf.id = "shelf-1"
-        shelf.name = "Shelf A"
-        shelf.home_location_id = "loc-2"
+        shelf = SimpleNamespace(id="shelf-1", name="Shelf A", home_location_id="loc-2")
         mock.get_shelves.return_value = [shelf]
         conn = _make_conn(mock)
 
@@ -94,7 +86,7 @@ class TestShelves:
 class TestCamera:
     def test_front_camera(self):
         mock = MagicMock()
-        mock.get_front_camera_ros_compressed_image.return_value = MagicMock(
+        mock.get_front_camera_ros_compressed_image.return_value = SimpleNamespace(
             data=b"\xff\xd8test-jpeg", format="jpeg"
         )
         conn = _make_conn(mock)
@@ -107,7 +99,7 @@ class TestCamera:
 
     def test_back_camera(self):
         mock = MagicMock()
-        mock.get_back_camera_ros_compressed_image.return_value = MagicMock(
+        mock.get_back_camera_ros_compressed_image.return_value = SimpleNamespace(
             data=b"\xff\xd8back", format="jpeg"
         )
         conn = _make_conn(mock)
@@ -119,12 +111,14 @@ class TestCamera:
 class TestMap:
     def test_get_map(self):
         mock = MagicMock()
-        png_map = MagicMock()
-        png_map.data = b"\x89PNGtest"
-        png_map.name = "Floor1"
-        png_map.resolution = 0.05
-        png_map.width = 200
-        png_map.height = 200
+        png_map = SimpleNamespace(
+            data=b"\x89PNGtest",
+            name="Floor1",
+            resolution=0.05,
+            width=200,
+            height=200,
+            origin=SimpleNamespace(x=0.0, y=0.0),
+        )
         mock.get_png_map.return_value = png_map
         conn = _make_conn(mock)
 
@@ -136,10 +130,7 @@ class TestMap:
 
     def test_list_maps(self):
         mock = MagicMock()
-        m = MagicMock()
-        m.id = "map-1"
-        m.name = "Floor1"
-        mock.get_map_list.return_value = [m]
+        mock.get_map_list.return_value = [SimpleNamespace(id="map-1", name="Floor1")]
         mock.get_current_map_id.return_value = "map-1"
         conn = _make_conn(mock)
 
@@ -160,9 +151,10 @@ class TestErrors:
 
     def test_error_definitions(self):
         mock = MagicMock()
-        err_info = MagicMock()
-        err_info.title_en = "Shelf dropped"
-        err_info.description_en = "The shelf was dropped during movement"
+        err_info = SimpleNamespace(
+            title_en="Shelf dropped",
+            description_en="The shelf was dropped during movement",
+        )
         mock.get_robot_error_code.return_value = {14606: err_info}
         conn = _make_conn(mock)
 
@@ -195,9 +187,8 @@ class TestIsReady:
     def test_ready(self):
         mock = MagicMock()
         conn = _make_conn(mock)
-        # Re-assign stub after _make_conn (which replaces it with a real one)
         mock_stub = MagicMock()
-        mock_stub.IsReady.return_value = MagicMock(ready=True)
+        mock_stub.IsReady.return_value = SimpleNamespace(ready=True)
         mock.stub = mock_stub
 
         result = KachakaQueries(conn).is_ready()
@@ -208,7 +199,7 @@ class TestIsReady:
         mock = MagicMock()
         conn = _make_conn(mock)
         mock_stub = MagicMock()
-        mock_stub.IsReady.return_value = MagicMock(ready=False)
+        mock_stub.IsReady.return_value = SimpleNamespace(ready=False)
         mock.stub = mock_stub
 
         result = KachakaQueries(conn).is_ready()
@@ -249,14 +240,15 @@ class TestManualControlQuery:
 class TestCameraIntrinsics:
     def test_front_camera_intrinsics(self):
         mock = MagicMock()
-        cam_info = MagicMock()
-        cam_info.width = 1280
-        cam_info.height = 720
-        cam_info.distortion_model = "plumb_bob"
-        cam_info.D = [-0.28, 0.10, -0.0002, -0.002, -0.019]
-        cam_info.K = [510.0, 0.0, 628.0, 0.0, 504.0, 349.0, 0.0, 0.0, 1.0]
-        cam_info.R = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
-        cam_info.P = [510.0, 0.0, 628.0, 0.0, 0.0, 504.0, 349.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+        cam_info = SimpleNamespace(
+            width=1280,
+            height=720,
+            distortion_model="plumb_bob",
+            D=[-0.28, 0.10, -0.0002, -0.002, -0.019],
+            K=[510.0, 0.0, 628.0, 0.0, 504.0, 349.0, 0.0, 0.0, 1.0],
+            R=[1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+            P=[510.0, 0.0, 628.0, 0.0, 0.0, 504.0, 349.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+        )
         mock.get_front_camera_ros_camera_info.return_value = cam_info
         conn = _make_conn(mock)
 
@@ -271,14 +263,15 @@ class TestCameraIntrinsics:
 
     def test_back_camera_intrinsics(self):
         mock = MagicMock()
-        cam_info = MagicMock()
-        cam_info.width = 1280
-        cam_info.height = 720
-        cam_info.distortion_model = "plumb_bob"
-        cam_info.D = [-0.29, 0.11, 0.0, 0.0, -0.02]
-        cam_info.K = [504.0, 0.0, 610.0, 0.0, 499.0, 333.0, 0.0, 0.0, 1.0]
-        cam_info.R = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
-        cam_info.P = [504.0, 0.0, 610.0, 0.0, 0.0, 499.0, 333.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+        cam_info = SimpleNamespace(
+            width=1280,
+            height=720,
+            distortion_model="plumb_bob",
+            D=[-0.29, 0.11, 0.0, 0.0, -0.02],
+            K=[504.0, 0.0, 610.0, 0.0, 499.0, 333.0, 0.0, 0.0, 1.0],
+            R=[1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+            P=[504.0, 0.0, 610.0, 0.0, 0.0, 499.0, 333.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+        )
         mock.get_back_camera_ros_camera_info.return_value = cam_info
         conn = _make_conn(mock)
 
@@ -288,14 +281,15 @@ class TestCameraIntrinsics:
 
     def test_tof_camera_intrinsics(self):
         mock = MagicMock()
-        cam_info = MagicMock()
-        cam_info.width = 160
-        cam_info.height = 120
-        cam_info.distortion_model = "plumb_bob"
-        cam_info.D = [0.0, 0.0, 0.0, 0.0, 0.0]
-        cam_info.K = [80.0, 0.0, 80.0, 0.0, 80.0, 60.0, 0.0, 0.0, 1.0]
-        cam_info.R = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
-        cam_info.P = [80.0, 0.0, 80.0, 0.0, 0.0, 80.0, 60.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+        cam_info = SimpleNamespace(
+            width=160,
+            height=120,
+            distortion_model="plumb_bob",
+            D=[0.0, 0.0, 0.0, 0.0, 0.0],
+            K=[80.0, 0.0, 80.0, 0.0, 80.0, 60.0, 0.0, 0.0, 1.0],
+            R=[1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+            P=[80.0, 0.0, 80.0, 0.0, 0.0, 80.0, 60.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+        )
         mock.get_tof_camera_ros_camera_info.return_value = cam_info
         conn = _make_conn(mock)
 
@@ -326,19 +320,14 @@ class TestStaticTransform:
     def test_get_static_transform(self):
         mock = MagicMock()
         conn = _make_conn(mock)
-        # Re-assign stub after _make_conn (which replaces it with a real one)
         mock_stub = MagicMock()
-        tf = MagicMock()
-        tf.header.frame_id = "base_link"
-        tf.child_frame_id = "camera_link"
-        tf.translation.x = 0.1
-        tf.translation.y = 0.0
-        tf.translation.z = 0.5
-        tf.rotation.x = 0.0
-        tf.rotation.y = 0.0
-        tf.rotation.z = 0.0
-        tf.rotation.w = 1.0
-        mock_stub.GetStaticTransform.return_value = MagicMock(transforms=[tf])
+        tf = SimpleNamespace(
+            header=SimpleNamespace(frame_id="base_link"),
+            child_frame_id="camera_link",
+            translation=SimpleNamespace(x=0.1, y=0.0, z=0.5),
+            rotation=SimpleNamespace(x=0.0, y=0.0, z=0.0, w=1.0),
+        )
+        mock_stub.GetStaticTransform.return_value = SimpleNamespace(transforms=[tf])
         mock.stub = mock_stub
 
         result = KachakaQueries(conn).get_static_transform()
@@ -356,7 +345,7 @@ class TestStaticTransform:
         mock = MagicMock()
         conn = _make_conn(mock)
         mock_stub = MagicMock()
-        mock_stub.GetStaticTransform.return_value = MagicMock(transforms=[])
+        mock_stub.GetStaticTransform.return_value = SimpleNamespace(transforms=[])
         mock.stub = mock_stub
 
         result = KachakaQueries(conn).get_static_transform()
@@ -367,14 +356,15 @@ class TestStaticTransform:
 class TestTofImage:
     def test_get_tof_image_raw(self):
         mock = MagicMock()
-        tof_img = MagicMock()
-        tof_img.width = 160
-        tof_img.height = 120
-        tof_img.encoding = "16UC1"
-        tof_img.step = 320
-        tof_img.data = b"\x00" * 38400
-        tof_img.is_bigendian = False
-        tof_img.header = MagicMock(frame_id="tof_camera")
+        tof_img = SimpleNamespace(
+            width=160,
+            height=120,
+            encoding="16UC1",
+            step=320,
+            data=b"\x00" * 38400,
+            is_bigendian=False,
+            header=SimpleNamespace(frame_id="tof_camera"),
+        )
         mock.get_tof_camera_ros_image.return_value = tof_img
         conn = _make_conn(mock)
 
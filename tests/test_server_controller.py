@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import sys
-from types import ModuleType
-from unittest.mock import MagicMock, patch
+from types import ModuleType, SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -55,50 +55,55 @@ from mcp_server.server import (
 
 
 def _make_mock_conn():
+    """Create a KachakaConnection around a mocked client, bypassing the pool."""
     mock_client = MagicMock()
-    pose = MagicMock()
-    pose.x, pose.y, pose.theta = 1.0, 2.0, 0.5
-    mock_client.get_robot_pose.return_value = pose
+    mock_client.get_robot_pose.return_value = SimpleNamespace(x=1.0, y=2.0, theta=0.5)
     mock_client.get_battery_info.return_value = (85, "DISCHARGING")
     mock_client.is_command_running.return_value = False
-    with patch("kachaka_core.connection.KachakaApiClient", return_value=mock_client):
-        conn = KachakaConnection.get(f"mock-{id(mock_client)}")
+    conn = KachakaConnection(f"mock-{id(mock_client)}")
+    conn._client = mock_client
     return conn, mock_client
 
 
 @pytest.fixture(autouse=True)
 def _clean_state():
-    """Clear controller dict and connection pool before/after each test."""
+    """Clear the controller dict before/after each test."""
     _controllers.clear()
-    KachakaConnection.clear_pool()
     yield
     for ctrl in _controllers.values():
         ctrl.stop()
     _controllers.clear()
-    KachakaConnection.clear_pool()
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    """A mock connection that ``start_controller`` receives from ``KachakaConnection.get``."""
+    conn, _ = _make_mock_conn()
+    monkeypatch.setattr("mcp_server.server.KachakaConnection.get", lambda *a, **kw: conn)
+    return conn
+
+
+@pytest.fixture
+def started_ip(conn):
+    """IP of a robot whose controller ``start_controller`` has already started."""
+    start_controller(conn.target)
+    return conn.target
 
 
 class TestStartStopController:
-    def test_start_creates_entry(self):
-        conn, _ = _make_mock_conn()
+    def test_start_creates_entry(self, conn):
         ip = conn.target
-        with patch("mcp_server.server.KachakaConnection.get", return_value=conn):
-            result = start_controller(ip)
+        result = start_controller(ip)
         assert result["ok"] is True
         assert result["message"] == "controller started"
         key = _controller_key(ip)
         assert key in _controllers
         assert isinstance(_controllers[key], RobotController)
-        _controllers[key].stop()
 
-    def test_stop_removes_entry(self):
-        conn, _ = _make_mock_conn()
-        ip = conn.target
-        with patch("mcp_server.server.KachakaConnection.get", return_value=conn):
-            start_controller(ip)
-        key = _controller_key(ip)
+    def test_stop_removes_entry(self, started_ip):
+        key = _controller_key(started_ip)
         assert key in _controllers
-        result = stop_controller(ip)
+        result = stop_controller(started_ip)
         assert result["ok"] is True
         assert result["message"] == "controller stopped"
         assert key not in _controllers
@@ -110,33 +115,29 @@ class TestStartStopController:
 
 
 class TestStartControllerIdempotent:
-    def test_second_call_returns_existing(self):
-        conn, _ = _make_mock_conn()
+    def test_second_call_returns_existing(self, conn):
         ip = conn.target
-        with patch("mcp_server.server.KachakaConnection.get", return_value=conn):
-            result1 = start_controller(ip)
-            result2 = start_controller(ip)
+        result1 = start_controller(ip)
+        result2 = start_controller(ip)
         assert result1["ok"] is True
         assert result2["ok"] is True
         assert result2["message"] == "controller already running"
         key = _controller_key(ip)
         assert key in _controllers
-        _controllers[key].stop()
 
 
 class TestControllerCommandWithoutStart:
-    def test_move_shelf_without_start(self):
-        result = controller_move_shelf("10.0.0.1", "ShelfA", "Room1")
-        assert result["ok"] is False
-        assert result["error"] == "controller not started"
-
-    def test_return_shelf_without_start(self):
-        result = controller_return_shelf("10.0.0.1", "ShelfA")
-        assert result["ok"] is False
-        assert result["error"] == "controller not started"
-
-    def test_move_to_location_without_start(self):
-        result = controller_move_to_location("10.0.0.1", "Kitchen")
+    @pytest.mark.parametrize(
+        "tool,args",
+        [
+            (controller_move_shelf, ("10.0.0.1", "ShelfA", "Room1")),
+            (controller_return_shelf, ("10.0.0.1", "ShelfA")),
+            (controller_move_to_location, ("10.0.0.1", "Kitchen")),
+        ],
+        ids=["move_shelf", "return_shelf", "move_to_location"],
+    )
+    def test_command_without_start(self, tool, args):
+        result = tool(*args)
         assert result["ok"] is False
         assert result["error"] == "controller not started"
 
@@ -147,12 +148,8 @@ class TestGetControllerState:
         assert result["ok"] is False
         assert result["error"] == "controller not started"
 
-    def test_returns_state_dict(self):
-        conn, _ = _make_mock_conn()
-        ip = conn.target
-        with patch("mcp_server.server.KachakaConnection.get", return_value=conn):
-            start_controller(ip)
-        result = get_controller_state(ip)
+    def test_returns_state_dict(self, started_ip):
+        result = get_controller_state(started_ip)
         assert result["ok"] is True
         expected_keys = {
             "ok", "battery_pct", "pose_x", "pose_y", "pose_theta",
@@ -160,4 +157,3 @@ class TestGetControllerState:
             "shelf_dropped",
         }
         assert expected_keys == set(result.keys())
-        _controllers[_controller_key(ip)].stop()
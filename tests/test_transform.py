@@ -12,6 +12,10 @@ from kachaka_core.connection import ConnectionState, KachakaConnection
 from kachaka_core.transform import TransformStreamer, _parse_transform
 
 
+# KachakaConnection.get probes its channels; keep those off the network.
+pytestmark = pytest.mark.usefixtures("channels")
+
+
 @pytest.fixture(autouse=True)
 def _clean_pool():
     KachakaConnection.clear_pool()